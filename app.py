@@ -1,5 +1,12 @@
+import os
+import tempfile
+import zipfile
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import plotly.express as px
 
 # ─────────────────────────────────────────
@@ -17,14 +24,309 @@ st.markdown("""
 # ─────────────────────────────────────────
 # LOAD DATA
 # ─────────────────────────────────────────
+# columns the dashboard reads, with explicit Arrow types so nothing is inferred;
+# numeric columns use the narrowest type that fits (result_margin has nulls)
+MATCH_COLUMNS = {
+    "season": pa.string(), "date": pa.string(), "team1": pa.string(), "team2": pa.string(),
+    "winner": pa.string(), "venue": pa.string(), "city": pa.string(), "player_of_match": pa.string(),
+    "toss_winner": pa.string(), "toss_decision": pa.string(), "result": pa.string(),
+    "result_margin": pa.float32(),
+}
+DELIVERY_COLUMNS = {
+    "batter": pa.string(), "batsman_runs": pa.int16(), "bowler": pa.string(),
+    "is_wicket": pa.uint8(), "dismissal_kind": pa.string(),
+}
+TEAM_COLUMNS = ["team1", "team2", "toss_winner", "winner"]
+MATCH_CATEGORIES = TEAM_COLUMNS + ["venue", "city", "toss_decision", "player_of_match"]
+DELIVERY_CATEGORIES = ["batter", "bowler", "dismissal_kind"]
+
+def read_csv(csv_path, columns):
+    # Arrow's multithreaded tokenizer; unused columns are skipped, not parsed
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+    convert_options = pacsv.ConvertOptions(column_types=columns, include_columns=list(columns),
+                                           strings_can_be_null=True)
+    if csv_path.endswith(".zip"):
+        with zipfile.ZipFile(csv_path) as archive:
+            # reads directly from zip
+            with archive.open(archive.namelist()[0]) as f:
+                return pacsv.read_csv(f, read_options=read_options, convert_options=convert_options)
+    return pacsv.read_csv(csv_path, read_options=read_options, convert_options=convert_options)
+
+def cache_is_fresh(csv_path, parquet_path, columns):
+    # rebuild when the source is newer or the stored schema no longer matches
+    try:
+        if os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+            return False
+        schema = pq.read_schema(parquet_path)
+    except (OSError, pa.ArrowException):
+        return False
+    return schema.remove_metadata().equals(pa.schema(columns))
+
+def write_parquet(table, parquet_path):
+    # write beside the target and rename, so no reader ever sees a partial file
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(parquet_path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(os.path.abspath(parquet_path)))
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_path, compression="zstd", use_dictionary=True)
+        os.replace(tmp_path, parquet_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def load_parquet(parquet_path, columns, categories):
+    # dictionary-encoded pages come back as pandas categoricals, with the
+    # categories in first-appearance order; sort them to match astype("category")
+    df = pd.read_parquet(parquet_path, engine="pyarrow", columns=list(columns),
+                         read_dictionary=categories)
+    for c in categories:
+        df[c] = df[c].cat.reorder_categories(df[c].cat.categories.sort_values())
+    return df
+
+def read_parquet(csv_path, parquet_path, columns, categories):
+    # one-time conversion: parse the CSV once, then reuse the columnar copy
+    if cache_is_fresh(csv_path, parquet_path, columns):
+        try:
+            return load_parquet(parquet_path, columns, categories)
+        except (OSError, pa.ArrowException):
+            pass  # unreadable cache: rebuild it below
+    table = read_csv(csv_path, columns)
+    try:
+        write_parquet(table, parquet_path)
+    except OSError:
+        # read-only deploy: serve straight from the Arrow table
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        return df.astype(dict.fromkeys(categories, "category"))
+    return load_parquet(parquet_path, columns, categories)
+
+@st.cache_data
+def load_matches():
+    matches = read_parquet("matches.csv", "matches.parquet", MATCH_COLUMNS, MATCH_CATEGORIES)
+    # share one team dtype so toss_winner == winner compares codes, not strings
+    team_categories = pd.api.types.union_categoricals([matches[c] for c in TEAM_COLUMNS],
+                                                      sort_categories=True).categories
+    for c in TEAM_COLUMNS:
+        # set_categories recodes; astype would treat a reordering as a no-op
+        matches[c] = matches[c].cat.set_categories(team_categories)
+    # sidebar options are fixed per dataset, so build them once here
+    seasons = sorted(matches["season"].unique())
+    teams = sorted(set(matches["team1"].unique()) | set(matches["team2"].unique()))
+    return matches, seasons, teams
+
+@st.cache_data
+def load_deliveries():
+    # only the Player Performance aggregates need this, so it is loaded on demand
+    return read_parquet("deliveries.zip", "deliveries.parquet", DELIVERY_COLUMNS, DELIVERY_CATEGORIES)
+
+matches, all_seasons, all_teams = load_matches()
+
+# ─────────────────────────────────────────
+# CACHED AGGREGATES
+# ─────────────────────────────────────────
+# the loaded frames never change, so the leading underscore keeps
+# Streamlit from hashing them on every call; the deliveries aggregates
+# load their own input so a warm cache never touches that frame
+
+def apply_filter(matches, season, team):
+    # build one boolean mask and take a single slice instead of copying up front
+    mask = np.ones(len(matches), dtype=bool)
+    if season != "All":
+        mask &= matches["season"].to_numpy() == season
+    if team != "All":
+        mask &= (matches["team1"] == team).to_numpy() | (matches["team2"] == team).to_numpy()
+    return matches.loc[mask]
+
+def value_counts(column, columns, k=None):
+    # histogram the category codes (NaN is -1); like Series.value_counts, ties
+    # go to the value seen first in the filtered rows
+    codes = column.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+    present, first_seen = np.unique(codes, return_index=True)
+    counts = np.bincount(codes, minlength=len(column.cat.categories))[present]
+    order = np.lexsort((first_seen, -counts))[:k]
+    return pd.DataFrame({columns[0]: column.cat.categories[present[order]], columns[1]: counts[order]})
+
+def top_margins(df, result, k=10):
+    # O(n) partition to find the k-th largest margin, then order just the k rows;
+    # ties at the cut-off keep the earliest matches, as nlargest(keep="first") did
+    all_margins = df["result_margin"].to_numpy()
+    rows = np.flatnonzero((df["result"].to_numpy() == result) & ~np.isnan(all_margins))
+    margins = all_margins[rows]
+    k = min(k, rows.size)
+    if k:
+        cutoff = np.partition(margins, -k)[-k]
+        above = np.flatnonzero(margins > cutoff)
+        top = np.concatenate([above, np.flatnonzero(margins == cutoff)[:k - above.size]])
+        rows = rows[top[np.argsort(-margins[top], kind="stable")]]
+    return df.iloc[rows[:k]][["winner","result_margin","season"]]
+
+def summarize(df):
+    wins = value_counts(df["winner"], ["Team", "Wins"])
+    toss = value_counts(df["toss_decision"], ["Decision", "Count"])
+    # team columns share a dtype, so equal codes mean the same team
+    toss_match_win = df["toss_winner"].cat.codes.to_numpy() == df["winner"].cat.codes.to_numpy()
+    toss_effect = pd.Series(toss_match_win).value_counts().reset_index()
+    toss_effect.columns = ["Won Match After Toss", "Count"]
+    toss_effect["Won Match After Toss"] = toss_effect["Won Match After Toss"].map({True: "Yes", False: "No"})
+    venues = value_counts(df["venue"], ["Venue", "Matches"], k=10)
+    potm = value_counts(df["player_of_match"], ["Player", "Awards"], k=10)
+    return {
+        "kpis": (len(df), df["venue"].nunique(), df["city"].nunique(), df["season"].nunique()),
+        "wins": wins,
+        "toss": toss,
+        "toss_effect": toss_effect,
+        "venues": venues,
+        "potm": potm,
+        "by_runs": top_margins(df, "runs"),
+        "by_wkts": top_margins(df, "wickets"),
+    }
+
+@st.cache_data
+def summaries(season, team, _matches):
+    # one entry per sidebar combination, built the first time it is selected
+    return summarize(apply_filter(_matches, season, team))
+
+@st.cache_data
+def raw_table(season, team, _matches):
+    df = apply_filter(_matches, season, team)
+    return df[["season","date","team1","team2","winner","venue","player_of_match","toss_winner","toss_decision"]].reset_index(drop=True)
+
+def sum_by_group(column, values):
+    # single pass over the category codes; bincount is the C sum-by-group kernel
+    codes = column.cat.codes.to_numpy()
+    valid = codes >= 0  # NaN is -1
+    totals = np.bincount(codes[valid], weights=values[valid],
+                         minlength=len(column.cat.categories))
+    return column.cat.categories, totals.astype(np.int64)
+
+def top_k(names, totals, columns, k=10):
+    # partition for the k-th largest total; ties go to the earlier (alphabetical) category
+    k = min(k, totals.size)
+    idx = np.arange(0)
+    if k:
+        cutoff = np.partition(totals, -k)[-k]
+        above = np.flatnonzero(totals > cutoff)
+        idx = np.concatenate([above, np.flatnonzero(totals == cutoff)[:k - above.size]])
+    idx = idx[np.argsort(-totals[idx], kind="stable")]
+    return pd.DataFrame({columns[0]: names[idx], columns[1]: totals[idx]})
+
+@st.cache_data
+def matches_per_season(_matches):
+    return _matches.groupby("season", sort=True, observed=True).size().reset_index(name="Matches")
+
+@st.cache_data
+def top_batsmen():
+    deliveries = load_deliveries()
+    names, runs = sum_by_group(deliveries["batter"], deliveries["batsman_runs"].to_numpy())
+    return top_k(names, runs, ["Batter", "Total Runs"])
+
+@st.cache_data
+def top_bowlers():
+    deliveries = load_deliveries()
+    # one fused mask over integer codes, then an unweighted bincount;
+    # -2 is never a valid code (NaN is -1) if no run outs were loaded
+    dismissal = deliveries["dismissal_kind"].cat
+    runout_code = dismissal.categories.get_loc("run out") if "run out" in dismissal.categories else -2
+    credited = (deliveries["is_wicket"].to_numpy() == 1) & (dismissal.codes.to_numpy() != runout_code)
+    bowler = deliveries["bowler"].cat
+    wickets = np.bincount(bowler.codes.to_numpy()[credited], minlength=len(bowler.categories))
+    return top_k(bowler.categories, wickets, ["Bowler", "Wickets"])
+
+# ─────────────────────────────────────────
+# CHART BUILDERS
+# ─────────────────────────────────────────
+# figures are cached too, keyed on the sidebar selection, so a rerun only
+# rebuilds the charts whose inputs changed
+
+WEBGL_THRESHOLD = 5000
+
+def line_render_mode(data):
+    # large line/scatter traces go to WebGL; small ones stay crisp as SVG
+    return "webgl" if len(data) > WEBGL_THRESHOLD else "svg"
+
+@st.cache_data
+def fig_most_wins(season, team, _matches):
+    fig = px.bar(summaries(season, team, _matches)["wins"], x="Wins", y="Team", orientation="h",
+                 color="Wins", color_continuous_scale="Oranges",
+                 title="Total Wins per Team")
+    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
+    return fig
+
+@st.cache_data
+def fig_toss_decision(season, team, _matches):
+    fig = px.pie(summaries(season, team, _matches)["toss"], names="Decision", values="Count",
+                 color_discrete_sequence=["#f0a500", "#1f77b4"],
+                 title="Bat vs Field after Toss")
+    fig.update_traces(textposition="inside", textinfo="percent+label")
+    return fig
+
+@st.cache_data
+def fig_matches_per_season(_matches):
+    season_matches = matches_per_season(_matches)
+    fig = px.line(season_matches, x="season", y="Matches",
+                  markers=True, title="Matches Played Each Season",
+                  color_discrete_sequence=["#f0a500"],
+                  render_mode=line_render_mode(season_matches))
+    fig.update_layout(xaxis_title="Season", yaxis_title="Matches")
+    return fig
+
+@st.cache_data
+def fig_toss_effect(season, team, _matches):
+    fig = px.pie(summaries(season, team, _matches)["toss_effect"], names="Won Match After Toss", values="Count",
+                 color_discrete_sequence=["#2ecc71", "#e74c3c"],
+                 title="Toss Winner = Match Winner?")
+    fig.update_traces(textposition="inside", textinfo="percent+label")
+    return fig
+
+@st.cache_data
+def fig_top_venues(season, team, _matches):
+    fig = px.bar(summaries(season, team, _matches)["venues"], x="Matches", y="Venue", orientation="h",
+                 color="Matches", color_continuous_scale="Blues",
+                 title="Most Used Venues")
+    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
+    return fig
+
+@st.cache_data
+def fig_top_potm(season, team, _matches):
+    fig = px.bar(summaries(season, team, _matches)["potm"], x="Awards", y="Player", orientation="h",
+                 color="Awards", color_continuous_scale="Purples",
+                 title="Most Player of the Match Awards")
+    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
+    return fig
+
+@st.cache_data
+def fig_top_batsmen():
+    fig = px.bar(top_batsmen(), x="Total Runs", y="Batter", orientation="h",
+                 color="Total Runs", color_continuous_scale="Reds",
+                 title="Highest Run Scorers in IPL History")
+    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
+    return fig
+
+@st.cache_data
+def fig_top_bowlers():
+    fig = px.bar(top_bowlers(), x="Wickets", y="Bowler", orientation="h",
+                 color="Wickets", color_continuous_scale="Greens",
+                 title="Most Wickets in IPL History")
+    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
+    return fig
+
 @st.cache_data
-def load_data():
-    matches = pd.read_csv("matches.csv")
-    deliveries = pd.read_csv("deliveries.zip")  # reads directly from zip
-    matches["date"] = pd.to_datetime(matches["date"])
-    return matches, deliveries
+def fig_by_runs(season, team, _matches):
+    fig = px.bar(summaries(season, team, _matches)["by_runs"], x="result_margin", y="winner", orientation="h",
+                 color="result_margin", color_continuous_scale="Oranges",
+                 hover_data=["season"],
+                 title="Biggest Wins by Runs")
+    fig.update_layout(yaxis_title="Winning Team", xaxis_title="Runs", height=400)
+    return fig
 
-matches, deliveries = load_data()
+@st.cache_data
+def fig_by_wickets(season, team, _matches):
+    fig = px.bar(summaries(season, team, _matches)["by_wkts"], x="result_margin", y="winner", orientation="h",
+                 color="result_margin", color_continuous_scale="Blues",
+                 hover_data=["season"],
+                 title="Biggest Wins by Wickets")
+    fig.update_layout(yaxis_title="Winning Team", xaxis_title="Wickets", height=400)
+    return fig
 
 # ─────────────────────────────────────────
 # SIDEBAR FILTERS
@@ -32,18 +334,12 @@ matches, deliveries = load_data()
 st.sidebar.title("🏏 IPL Dashboard")
 st.sidebar.markdown("---")
 
-all_seasons = sorted(matches["season"].unique())
 selected_season = st.sidebar.selectbox("📅 Select Season", ["All"] + all_seasons)
 
-all_teams = sorted(set(matches["team1"].unique()) | set(matches["team2"].unique()))
 selected_team = st.sidebar.selectbox("🏟️ Select Team", ["All"] + all_teams)
 
 # Filter
-df = matches.copy()
-if selected_season != "All":
-    df = df[df["season"] == selected_season]
-if selected_team != "All":
-    df = df[(df["team1"] == selected_team) | (df["team2"] == selected_team)]
+summary = summaries(selected_season, selected_team, matches)
 
 # ─────────────────────────────────────────
 # HEADER
@@ -56,10 +352,11 @@ st.markdown("---")
 # KPI CARDS
 # ─────────────────────────────────────────
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("🎯 Total Matches", len(df))
-col2.metric("🏟️ Venues", df["venue"].nunique())
-col3.metric("🌆 Cities", df["city"].nunique())
-col4.metric("🏆 Seasons", df["season"].nunique())
+n_matches, n_venues, n_cities, n_seasons = summary["kpis"]
+col1.metric("🎯 Total Matches", n_matches)
+col2.metric("🏟️ Venues", n_venues)
+col3.metric("🌆 Cities", n_cities)
+col4.metric("🏆 Seasons", n_seasons)
 
 st.markdown("---")
 
@@ -70,23 +367,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("🏆 Most Wins by Team")
-    wins = df["winner"].value_counts().reset_index()
-    wins.columns = ["Team", "Wins"]
-    fig = px.bar(wins, x="Wins", y="Team", orientation="h",
-                 color="Wins", color_continuous_scale="Oranges",
-                 title="Total Wins per Team")
-    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_most_wins(selected_season, selected_team, matches), use_container_width=True)
 
 with col2:
     st.subheader("🪙 Toss Decision")
-    toss = df["toss_decision"].value_counts().reset_index()
-    toss.columns = ["Decision", "Count"]
-    fig = px.pie(toss, names="Decision", values="Count",
-                 color_discrete_sequence=["#f0a500", "#1f77b4"],
-                 title="Bat vs Field after Toss")
-    fig.update_traces(textposition="inside", textinfo="percent+label")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_toss_decision(selected_season, selected_team, matches), use_container_width=True)
 
 # ─────────────────────────────────────────
 # ROW 2: Season-wise Matches + Toss Winner vs Match Winner
@@ -95,25 +380,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📅 Matches per Season")
-    season_matches = matches.groupby("season").size().reset_index(name="Matches")
-    fig = px.line(season_matches, x="season", y="Matches",
-                  markers=True, title="Matches Played Each Season",
-                  color_discrete_sequence=["#f0a500"])
-    fig.update_layout(xaxis_title="Season", yaxis_title="Matches")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_matches_per_season(matches), use_container_width=True)
 
 with col2:
     st.subheader("🎲 Does Winning Toss Help Win Match?")
-    df_toss = df.copy()
-    df_toss["toss_match_win"] = df_toss["toss_winner"] == df_toss["winner"]
-    toss_effect = df_toss["toss_match_win"].value_counts().reset_index()
-    toss_effect.columns = ["Won Match After Toss", "Count"]
-    toss_effect["Won Match After Toss"] = toss_effect["Won Match After Toss"].map({True: "Yes", False: "No"})
-    fig = px.pie(toss_effect, names="Won Match After Toss", values="Count",
-                 color_discrete_sequence=["#2ecc71", "#e74c3c"],
-                 title="Toss Winner = Match Winner?")
-    fig.update_traces(textposition="inside", textinfo="percent+label")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_toss_effect(selected_season, selected_team, matches), use_container_width=True)
 
 # ─────────────────────────────────────────
 # ROW 3: Top Venues + Player of the Match
@@ -122,23 +393,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("🏟️ Top 10 Venues by Matches Hosted")
-    venue_counts = df["venue"].value_counts().head(10).reset_index()
-    venue_counts.columns = ["Venue", "Matches"]
-    fig = px.bar(venue_counts, x="Matches", y="Venue", orientation="h",
-                 color="Matches", color_continuous_scale="Blues",
-                 title="Most Used Venues")
-    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_top_venues(selected_season, selected_team, matches), use_container_width=True)
 
 with col2:
     st.subheader("🌟 Top 10 Player of the Match Awards")
-    potm = df["player_of_match"].value_counts().head(10).reset_index()
-    potm.columns = ["Player", "Awards"]
-    fig = px.bar(potm, x="Awards", y="Player", orientation="h",
-                 color="Awards", color_continuous_scale="Purples",
-                 title="Most Player of the Match Awards")
-    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_top_potm(selected_season, selected_team, matches), use_container_width=True)
 
 # ─────────────────────────────────────────
 # ROW 4: TOP BATSMEN & BOWLERS
@@ -150,27 +409,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("🏏 Top 10 Run Scorers (All Time)")
-    top_batsmen = deliveries.groupby("batter")["batsman_runs"].sum().reset_index()
-    top_batsmen.columns = ["Batter", "Total Runs"]
-    top_batsmen = top_batsmen.sort_values("Total Runs", ascending=False).head(10)
-    fig = px.bar(top_batsmen, x="Total Runs", y="Batter", orientation="h",
-                 color="Total Runs", color_continuous_scale="Reds",
-                 title="Highest Run Scorers in IPL History")
-    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_top_batsmen(), use_container_width=True)
 
 with col2:
     st.subheader("🎳 Top 10 Wicket Takers (All Time)")
-    wickets = deliveries[deliveries["is_wicket"] == 1]
-    wickets = wickets[wickets["dismissal_kind"] != "run out"]
-    top_bowlers = wickets.groupby("bowler")["is_wicket"].sum().reset_index()
-    top_bowlers.columns = ["Bowler", "Wickets"]
-    top_bowlers = top_bowlers.sort_values("Wickets", ascending=False).head(10)
-    fig = px.bar(top_bowlers, x="Wickets", y="Bowler", orientation="h",
-                 color="Wickets", color_continuous_scale="Greens",
-                 title="Most Wickets in IPL History")
-    fig.update_layout(yaxis=dict(categoryorder="total ascending"), height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_top_bowlers(), use_container_width=True)
 
 # ─────────────────────────────────────────
 # ROW 5: Win by Runs / Win by Wickets
@@ -182,30 +425,20 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("🏃 Biggest Wins by Runs")
-    by_runs = df[df["result"] == "runs"].nlargest(10, "result_margin")[["winner","result_margin","season"]]
-    fig = px.bar(by_runs, x="result_margin", y="winner", orientation="h",
-                 color="result_margin", color_continuous_scale="Oranges",
-                 hover_data=["season"],
-                 title="Biggest Wins by Runs")
-    fig.update_layout(yaxis_title="Winning Team", xaxis_title="Runs", height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_by_runs(selected_season, selected_team, matches), use_container_width=True)
 
 with col2:
     st.subheader("🎯 Biggest Wins by Wickets")
-    by_wkts = df[df["result"] == "wickets"].nlargest(10, "result_margin")[["winner","result_margin","season"]]
-    fig = px.bar(by_wkts, x="result_margin", y="winner", orientation="h",
-                 color="result_margin", color_continuous_scale="Blues",
-                 hover_data=["season"],
-                 title="Biggest Wins by Wickets")
-    fig.update_layout(yaxis_title="Winning Team", xaxis_title="Wickets", height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig_by_wickets(selected_season, selected_team, matches), use_container_width=True)
 
 # ─────────────────────────────────────────
 # RAW DATA TABLE
 # ─────────────────────────────────────────
 st.markdown("---")
 with st.expander("📋 View Raw Match Data"):
-    st.dataframe(df[["season","date","team1","team2","winner","venue","player_of_match","toss_winner","toss_decision"]].reset_index(drop=True), use_container_width=True)
+    # the expander body always runs, so only build and ship the table on request
+    if st.checkbox("Load table"):
+        st.dataframe(raw_table(selected_season, selected_team, matches), use_container_width=True)
 
 st.markdown("---")
 st.caption("Built with ❤️ using Streamlit & Plotly | IPL Analytics Dashboard")